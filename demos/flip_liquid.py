@@ -12,27 +12,28 @@ GRAVITY = tensor([0, -9.81])
 DT = .2
 OBSTACLE = Box(x=(1, 25), y=(30, 33)).rotated(-20)
 ACCESSIBLE_CELLS = CenteredGrid(~OBSTACLE, 0, x=64, y=64)
+OBSTACLE_MASKS = fluid.obstacle_masks(OBSTACLE, StaggeredGrid(0, 0, x=64, y=64))  # stationary obstacle, rasterize once
 _OBSTACLE_POINTS = PointCloud(Cuboid(field.support(1 - ACCESSIBLE_CELLS, 'points'), x=2, y=2), bounds=ACCESSIBLE_CELLS.bounds)
 
 particles = distribute_points(union(Box(x=(15, 30), y=(50, 60)), Box(x=None, y=(-INF, 5))), x=64, y=64) * (0, 0)
 scene = vis.overlay(particles, _OBSTACLE_POINTS)  # only for plotting
+pressure = None
 
 
 # @jit_compile
-def step(particles):
+def step(particles, pressure):
     # --- Grid Operations ---
     velocity = prev_velocity = field.finite_fill(resample(particles, StaggeredGrid(0, 0, x=64, y=64), scatter=True, outside_handling='clamp'))
     occupied = resample(field.mask(particles), CenteredGrid(0, velocity.extrapolation.spatial_gradient(), velocity.bounds, velocity.resolution), scatter=True)
-    velocity, pressure = fluid.make_incompressible(velocity + GRAVITY * DT, [OBSTACLE], active=occupied)
+    velocity, pressure = fluid.make_incompressible(velocity + GRAVITY * DT, [OBSTACLE], Solve(x0=pressure), active=occupied, masks=OBSTACLE_MASKS)
     # --- Particle Operations ---
-    particles += resample(velocity - prev_velocity, to=particles)  # FLIP update
-    # particles = resample(velocity, particles)  # PIC update
+    particles = fluid.map_velocity_to_particles(particles, velocity, prev_velocity)  # FLIP update, pass viscosity=1 for PIC
     particles = advect.points(particles, velocity * mask(~OBSTACLE), DT, advect.finite_rk4)
     particles = fluid.boundary_push(particles, [OBSTACLE, ~particles.bounds])
     return particles, velocity, pressure
 
 
 for _ in view('scene,velocity,pressure', display='scene', play=True, namespace=globals()).range():
-    particles, velocity, pressure = step(particles)
+    particles, velocity, pressure = step(particles, pressure)
     scene = vis.overlay(particles.with_values(1), _OBSTACLE_POINTS)
     # vis.show(scene, pressure)
@@ -837,7 +837,7 @@ def mask(obj: Union[SampledFieldType, Geometry]) -> SampledFieldType:
     elif isinstance(obj, Geometry):
         return PointCloud(obj, 1, 0)
     elif isinstance(obj, CenteredGrid):
-        values = math.cast(obj.values != 0, int)
+        values = math.to_float(obj.values != 0)  # grids store floating point values, convert once
         return obj.with_values(values)
     else:
         raise ValueError(obj)
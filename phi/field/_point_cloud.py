@@ -168,7 +168,12 @@ class PointCloud(SampledField):
             `CenteredGrid`
         """
         closest_index = bounds.global_to_local(self.points) * resolution - 0.5
-        mode = 'add' if self._add_overlapping else 'mean'
+        if self._add_overlapping:
+            mode = 'add'
+        elif self._values.dtype.kind in (bool, int) and not may_vary_along(self._values, instance(self._values) & spatial(self._values)):
+            mode = 'update'  # masks: duplicates write the same value and integers are not differentiated. Avoids the second scatter needed for counting.
+        else:
+            mode = 'mean'
         base = math.zeros(resolution)
         if isinstance(self._extrapolation, ConstantExtrapolation):
             base += self._extrapolation.value
@@ -102,6 +102,14 @@ class BaseBox(Geometry):  # not a Subwoofer
         return distance
 
     def push(self, positions: Tensor, outward: bool = True, shift_amount: float = 0) -> Tensor:
+        """
+        See `Geometry.push()`.
+
+        Collections of boxes (instance dimensions) are pushed by broadcasting all positions against all boxes and summing the individual displacements.
+        This is exact for outward pushes as long as the boxes do not overlap.
+        It replaces one Python call per box by a single call at the cost of temporaries that scale with the number of boxes times the number of positions.
+        """
+        assert outward or not self.shape.instance, "Inward push is not supported for collections of boxes"
         loc_to_center = positions - self.center
         sgn_dist_from_surface = math.abs(loc_to_center) - self.half_size
         if outward:
@@ -111,7 +119,7 @@ class BaseBox(Geometry):  # not a Subwoofer
         else:
             shift = (sgn_dist_from_surface + shift_amount) * (sgn_dist_from_surface > 0)  # get positive distances (particles are outside) and add shift_amount
             shift = math.where(math.abs(shift) > math.abs(loc_to_center), math.abs(loc_to_center), shift)  # ensure inward shift ends at center
-        return positions + math.where(loc_to_center < 0, 1, -1) * shift
+        return positions + math.sum(math.where(loc_to_center < 0, 1, -1) * shift, self.shape.instance)
 
     def project(self, *dimensions: str):
         """ Project this box into a lower-dimensional space. """
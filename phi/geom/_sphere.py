@@ -112,7 +112,25 @@ class Sphere(Geometry):
         return Sphere(self._center[_keep_vector(item)], self._radius[item])
 
     def push(self, positions: Tensor, outward: bool = True, shift_amount: float = 0) -> Tensor:
-        raise NotImplementedError()
+        """
+        See `Geometry.push()`.
+        Positions are shifted radially using masks instead of branches.
+        Positions exactly at the center have no defined direction and are pushed along the first `vector` axis.
+
+        Collections of spheres (instance dimensions) are pushed by broadcasting all positions against all spheres and summing the individual displacements.
+        This is exact for outward pushes as long as the spheres do not overlap.
+        It replaces one Python call per sphere by a single call at the cost of temporaries that scale with the number of spheres times the number of positions.
+        """
+        assert outward or not self.shape.instance, "Inward push is not supported for collections of spheres"
+        loc_to_center = positions - self.center
+        distance = math.vec_length(loc_to_center)
+        if outward:
+            shift = (distance < self.radius) * (self.radius + shift_amount - distance)
+        else:
+            shift = (distance > self.radius) * -math.minimum(distance - self.radius + shift_amount, distance)  # inward shift ends at center
+        first_axis = math.wrap([1] + [0] * (self.spatial_rank - 1), self._center.shape.only('vector'))
+        direction = math.where(distance > 0, loc_to_center / math.where(distance > 0, distance, 1), first_axis)
+        return positions + math.sum(shift * direction, self.shape.instance)
 
     def __hash__(self):
         return hash(self._center) + hash(self._radius)
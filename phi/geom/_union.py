@@ -14,9 +14,10 @@ class Union(Geometry):
     def __init__(self, geometries):
         self._geometries = tuple(geometries)
         assert len(self._geometries) > 0
-        for g in self._geometries[1:]:
-            assert g.spatial_rank == self._geometries[0].spatial_rank
-        self._shape = merge_shapes(*[g.shape for g in geometries])
+        rank = self._geometries[0].spatial_rank
+        assert all(g.spatial_rank == rank for g in self._geometries), f"All geometries in a union must have the same spatial rank but got {[g.spatial_rank for g in self._geometries]}"
+        self._shape = merge_shapes(*[g.shape for g in self._geometries])
+        self._bounds = None  # bounding box, computed on first use
 
     @property
     def shape(self):
@@ -31,10 +32,16 @@ class Union(Geometry):
         return self.geometries[0].spatial_rank
 
     def lies_inside(self, location):
-        return math.any([geometry.lies_inside(location) for geometry in self.geometries], dim='0')
+        inside = self.geometries[0].lies_inside(location)
+        for geometry in self.geometries[1:]:  # running reduction avoids stacking one tensor per geometry
+            inside |= geometry.lies_inside(location)
+        return inside
 
     def approximate_signed_distance(self, location):
-        return math.min([geometry.approximate_signed_distance(location) for geometry in self.geometries], dim='0')
+        distance = self.geometries[0].approximate_signed_distance(location)
+        for geometry in self.geometries[1:]:
+            distance = math.minimum(distance, geometry.approximate_signed_distance(location))
+        return distance
 
     @property
     def center(self):
@@ -56,10 +63,15 @@ class Union(Geometry):
         return self._bounding_box().bounding_half_extent()
 
     def _bounding_box(self):
-        boxes = [bounding_box(g) for g in self.geometries]
-        lower = math.min([b.lower for b in boxes], dim='0')
-        upper = math.max([b.upper for b in boxes], dim='0')
-        return Box(lower, upper)
+        if self._bounds is None:
+            box = bounding_box(self.geometries[0])
+            lower, upper = box.lower, box.upper
+            for geometry in self.geometries[1:]:
+                box = bounding_box(geometry)
+                lower = math.minimum(lower, box.lower)
+                upper = math.maximum(upper, box.upper)
+            self._bounds = Box(lower, upper)
+        return self._bounds
 
     def shifted(self, delta) -> Geometry:
         return Union([geometry.shifted(delta) for geometry in self.geometries])
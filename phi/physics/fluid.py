@@ -9,10 +9,10 @@ from typing import Tuple, Callable, Union
 from phi import math, field
 from phiml.math import wrap, channel, Solve
 from phi.field import AngularVelocity, Grid, divergence, spatial_gradient, where, CenteredGrid, PointCloud, Field, resample
-from phi.geom import union, Geometry
+from phi.geom import union, Geometry, Box
 from ..field._embed import FieldEmbedding
 from ..field._grid import GridType, StaggeredGrid
-from phiml.math import extrapolation, NUMPY, batch, shape, non_channel, expand
+from phiml.math import extrapolation, NUMPY, batch, instance, shape, non_channel, expand
 from phiml.math._magic_ops import copy_with
 from phiml.math.extrapolation import Extrapolation
 
@@ -76,7 +76,8 @@ def make_incompressible(velocity: GridType,
                         obstacles: Union[Obstacle, Geometry, tuple, list] = (),
                         solve: Solve = Solve(),
                         active: CenteredGrid = None,
-                        order: int = 2) -> Tuple[GridType, CenteredGrid]:
+                        order: int = 2,
+                        masks: Tuple[CenteredGrid, Grid] = None) -> Tuple[GridType, CenteredGrid]:
     """
     Projects the given velocity field by solving for the pressure and subtracting its spatial_gradient.
     
@@ -86,6 +87,7 @@ def make_incompressible(velocity: GridType,
         velocity: Vector field sampled on a grid.
         obstacles: `Obstacle` or `phi.geom.Geometry` or tuple/list thereof to specify boundary conditions inside the domain.
         solve: `Solve` object specifying method and tolerances for the implicit pressure solve.
+            Pass the pressure of the previous time step as `x0` to warm-start the solver.
         active: (Optional) Mask for which cells the pressure should be solved.
             If given, the velocity may take `NaN` values where it does not contribute to the pressure.
             Also, the total divergence will never be subtracted if active is given, even if all values are 1.
@@ -93,6 +95,8 @@ def make_incompressible(velocity: GridType,
             For Higher-order schemes, the laplace operation is not conducted with a stencil exactly corresponding to the one used in divergence calculations but a smaller one instead.
             While this disrupts the formal correctness of the method it only induces insignificant errors and yields considerable performance gains.
             supported: explicit 2/4th order - implicit 6th order (obstacles are only supported with explicit 2nd order)
+        masks: (Optional) `(accessible, hard_bcs)` as returned by `obstacle_masks()` for `obstacles` and `velocity`.
+            Pass these for stationary obstacles to avoid rasterizing them in every call.
 
     Returns:
         velocity: divergence-free velocity of type `type(velocity)`
@@ -102,10 +106,10 @@ def make_incompressible(velocity: GridType,
     assert order == 2 or len(obstacles) == 0, f"obstacles are not supported with higher order schemes"
     input_velocity = velocity
     # --- Create masks ---
-    accessible_extrapolation = _accessible_extrapolation(input_velocity.extrapolation)
-    with NUMPY:
-        accessible = CenteredGrid(~union([obs.geometry for obs in obstacles]), accessible_extrapolation, velocity.bounds, velocity.resolution)
-        hard_bcs = field.stagger(accessible, math.minimum, input_velocity.extrapolation, type=type(velocity))
+    if masks is None:
+        masks = obstacle_masks(obstacles, velocity)
+    accessible, hard_bcs = masks
+    assert accessible.resolution == velocity.resolution and type(hard_bcs) == type(velocity), f"masks do not match velocity {velocity}"
     all_active = active is None
     if active is None:
         active = accessible.with_extrapolation(extrapolation.NONE)
@@ -113,9 +117,11 @@ def make_incompressible(velocity: GridType,
         active *= accessible  # no pressure inside obstacles
     # --- Linear solve ---
     velocity = apply_boundary_conditions(velocity, obstacles)
-    div = divergence(velocity, order=order) * active
-    if not all_active:  # NaN in velocity allowed
-        div = field.where(field.is_finite(div), div, 0)
+    div = divergence(velocity, order=order)
+    if all_active:
+        div *= active
+    else:  # NaN in velocity allowed. Mask and clean up in a single pass over the values.
+        div = div.with_values(math.where(math.is_finite(div.values), div.values * active.values, 0))
     if not input_velocity.extrapolation.is_flexible and all_active:
         solve = solve.with_preprocessing(_balance_divergence, active)
     if solve.x0 is None:
@@ -130,11 +136,39 @@ def make_incompressible(velocity: GridType,
     return velocity, pressure
 
 
+def obstacle_masks(obstacles: Union[Obstacle, Geometry, tuple, list], velocity: Grid) -> Tuple[CenteredGrid, Grid]:
+    """
+    Rasterizes obstacles onto the grid of `velocity` as required by `make_incompressible()`.
+    For stationary obstacles, compute these masks once and pass them to `make_incompressible()` via `masks`.
+
+    Args:
+        obstacles: `Obstacle` or `phi.geom.Geometry` or tuple/list thereof.
+        velocity: Velocity grid or a grid with the same type, resolution, bounds and extrapolation.
+
+    Returns:
+        accessible: `CenteredGrid` that is 1 outside obstacles and 0 inside.
+        hard_bcs: Connectivity of neighbouring cells, same type as `velocity`.
+    """
+    obstacles = _get_obstacles_for(obstacles, velocity)
+    accessible_extrapolation = _accessible_extrapolation(velocity.extrapolation)
+    with NUMPY:
+        if obstacles:
+            accessible = CenteredGrid(~union([obs.geometry for obs in obstacles]), accessible_extrapolation, velocity.bounds, velocity.resolution)
+        else:  # no geometry to rasterize, all cells are accessible
+            accessible = CenteredGrid(1, accessible_extrapolation, velocity.bounds, velocity.resolution)
+        hard_bcs = field.stagger(accessible, math.minimum, velocity.extrapolation, type=type(velocity))
+    return accessible, hard_bcs
+
+
 @math.jit_compile_linear(auxiliary_args='hard_bcs,active,order,implicit', forget_traces=True)  # jit compilation is required for boundary conditions that add a constant offset solving Ax + b = y
 def masked_laplace(pressure: CenteredGrid, hard_bcs: Grid, active: CenteredGrid, order=2, implicit: Solve = None) -> CenteredGrid:
     """
     Computes the laplace of `pressure` in the presence of obstacles.
 
+    Linear solves trace this function into a single sparse matrix.
+    Gradient, face masking and divergence are therefore applied as one fused 5-point (2D) or 7-point (3D) stencil per solver iteration.
+    For `order=2` and `active` equal to the accessible cells, this matrix is symmetric which is required for conjugate gradient solves.
+
     Args:
         pressure: Pressure field.
         hard_bcs: Mask encoding which cells are connected to each other.
@@ -219,6 +253,68 @@ def boundary_push(particles: PointCloud, obstacles: Union[tuple, list], offset:
     return particles.with_elements(particles.elements @ pos)
 
 
+def map_velocity_to_particles(particles: PointCloud, velocity: Grid, previous_velocity: Grid = None, viscosity: float = 0.) -> PointCloud:
+    """
+    Transfers the grid velocity back to the particles, blending the FLIP and PIC update rules.
+
+    FLIP increments each particle velocity by the change of the interpolated grid velocity while PIC replaces it by the interpolated grid velocity.
+    The result is `(1 - viscosity) * (v_p + v(x_p) - v_prev(x_p)) + viscosity * v(x_p)`.
+    Since grid interpolation is linear, this only requires a single interpolation of `v - (1 - viscosity) * v_prev` at the particle positions.
+
+    Args:
+        particles: `PointCloud` holding the particle velocities as values.
+        velocity: Grid velocity after the pressure projection.
+        previous_velocity: Grid velocity before the pressure projection, i.e. right after the particle-to-grid transfer.
+            If `None`, the particle velocities are replaced by `velocity` (PIC).
+        viscosity: Fraction of the PIC update between 0 (pure FLIP) and 1 (pure PIC).
+
+    Returns:
+        `PointCloud` with the same elements as `particles` and updated velocities.
+    """
+    if previous_velocity is None or viscosity == 1:
+        return resample(velocity, to=particles)
+    if viscosity == 0:
+        return particles + resample(velocity - previous_velocity, to=particles)
+    flip_fraction = 1 - viscosity
+    return particles * flip_fraction + resample(velocity - previous_velocity * flip_fraction, to=particles)
+
+
+def sort_particles_by_cell(particles: PointCloud, resolution: math.Shape, bounds: Box = None) -> PointCloud:
+    """
+    Reorders the particles along the Z-order (Morton) curve of the grid cells they lie in.
+
+    Particles drift over time so that their storage order decorrelates from their position.
+    Sorting them periodically makes neighbouring particles access neighbouring grid cells during particle-grid transfers, which improves memory locality.
+    The particles themselves are not modified, only their order along the instance dimension changes.
+
+    The sort is performed by NumPy on the host.
+    This function must therefore be called outside of JIT-compiled functions and copies the cell codes from the GPU if the particles reside there.
+
+    Args:
+        particles: `PointCloud` with a single instance dimension listing the particles.
+        resolution: Grid resolution as purely spatial `Shape`.
+        bounds: Physical extent of the grid. Defaults to `particles.bounds`.
+
+    Returns:
+        `PointCloud` containing the same particles and values in cell order.
+    """
+    import numpy as np
+    assert instance(particles).rank == 1, f"particles must have exactly one instance dimension but got {particles.shape}"
+    bounds = particles.bounds if bounds is None else bounds
+    dims = particles.points.vector.item_names
+    max_index = wrap([resolution.get_size(dim) - 1 for dim in dims], channel(vector=dims))
+    cell = math.to_int64(math.clip(bounds.global_to_local(particles.points) * resolution, 0, max_index))
+    code = math.zeros(cell.shape.without('vector'), dtype=math.DType(int, 64))
+    for bit in range(max((max(resolution.sizes) - 1).bit_length(), 1)):
+        for d, dim in enumerate(cell.vector.item_names):
+            code |= ((cell[{'vector': dim}] >> bit) & 1) << (bit * resolution.rank + d)
+    assert math.all_available(code), "sort_particles_by_cell() cannot be used while tracing"
+    codes = math.reshaped_numpy(code, [batch(code), instance(code)])
+    order = math.reshaped_tensor(np.argsort(codes, axis=-1, kind='stable'), [batch(code), instance(code)])
+    order = math.convert(order, particles.points.default_backend)
+    return particles[{instance(particles).name: order}]
+
+
 def _pressure_extrapolation(vext: Extrapolation):
     if vext == extrapolation.PERIODIC:
         return extrapolation.PERIODIC
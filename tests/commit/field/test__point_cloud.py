@@ -1,6 +1,7 @@
 from unittest import TestCase
 
-from phi.field import PointCloud
+from phi import math
+from phi.field import PointCloud, CenteredGrid, resample
 from phi.geom import Sphere
 from phiml.math import batch, stack, instance, expand, rename_dims, shape, vec
 
@@ -12,3 +13,11 @@ class GridTest(TestCase):
         c = expand(c, batch(b=2))
         c = rename_dims(c, 'points', 'particles')
         assert batch(b=2) & instance(particles=50) == shape(c)
+
+    def test_scatter_constant_values(self):
+        points = math.tensor([(.5, .5), (.6, .4), (2.5, 1.5), (10, 10)], instance('points'), math.channel(vector='x,y'))
+        expected = math.zeros(math.spatial(x=4, y=3))
+        expected = math.scatter(expected, math.tensor([(0, 0), (2, 1)], instance('points'), math.channel(vector='x,y')), 1)
+        for value in (1, .1, True):  # int and bool masks take the single-scatter path, floats are averaged
+            grid = resample(PointCloud(points, value, bounds=None), CenteredGrid(0, 0, x=4, y=3), scatter=True)
+            math.assert_close(expected * value, grid.values, abs_tolerance=1e-7)
@@ -3,7 +3,7 @@ from unittest import TestCase
 
 from phi import math
 from phi.geom import Box, union, Cuboid, embed
-from phiml.math import batch, channel
+from phiml.math import batch, channel, instance
 from phiml.math.magic import Shaped, Sliceable, Shapable
 
 
@@ -106,3 +106,11 @@ class TestBox(TestCase):
         box = Box(x=(1, 2), y=(2, None))
         self.assertEqual(box, Box['x,y', 1:2, 2:])
 
+    def test_push_collection(self):
+        b1, b2 = Box(x=(0, 2), y=(0, 2)), Box(x=(4, 6), y=(0, 3))
+        boxes = union(b1, b2)
+        self.assertIsInstance(boxes, Box)
+        positions = math.tensor([(0.8, 1.5), (5.2, 1), (3, 1)], instance('points'), channel(vector='x,y'))
+        pushed = boxes.push(positions, shift_amount=0.1)
+        math.assert_close(b2.push(b1.push(positions, shift_amount=0.1), shift_amount=0.1), pushed)
+        math.assert_close(math.tensor([(0.8, 2.1), (6.1, 1), (3, 1)], instance('points'), channel(vector='x,y')), pushed)
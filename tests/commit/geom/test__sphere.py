@@ -65,3 +65,18 @@ class TestSphere(TestCase):
         assert batch(bat=100) & instance(particles=50) & channel(vector='x,y') == s.shape
         s = flatten(s)
         assert batch(bat=100) & instance(flat=50) & channel(vector='x,y') == s.shape
+
+    def test_push(self):
+        sphere = Sphere(x=0, y=0, radius=2)
+        positions = math.tensor([(1, 0), (0, -.5), (3, 4), (0, 0)], instance('points'), channel(vector='x,y'))
+        pushed = sphere.push(positions, shift_amount=.5)
+        math.assert_close(math.tensor([(2.5, 0), (0, -2.5), (3, 4), (2.5, 0)], instance('points'), channel(vector='x,y')), pushed)  # center is pushed along x
+        pulled = sphere.push(positions, outward=False, shift_amount=.5)
+        math.assert_close(math.tensor([(1, 0), (0, -.5), (.9, 1.2), (0, 0)], instance('points'), channel(vector='x,y')), pulled)
+
+    def test_push_collection(self):
+        s1, s2 = Sphere(x=0, y=0, radius=1), Sphere(x=5, y=0, radius=2)
+        spheres = union(s1, s2)
+        self.assertIsInstance(spheres, Sphere)
+        positions = math.tensor([(.5, 0), (5, 1), (3, 3)], instance('points'), channel(vector='x,y'))
+        math.assert_close(s2.push(s1.push(positions, shift_amount=.1), shift_amount=.1), spheres.push(positions, shift_amount=.1))
@@ -13,6 +13,20 @@ class TestGeom(TestCase):
         union = geom.union(box, sphere)
         math.assert_close(union.approximate_signed_distance((1, 1)), union.approximate_signed_distance((0, -1)), 0)
 
+    def test_union_reduction(self):
+        geometries = [Box(x=1, y=1), Sphere(x=3, y=0, radius=1), Box(x=(-2, -1), y=(0, 2))]
+        union = geom.union(*geometries)
+        loc = math.wrap([(.5, .5), (3, .5), (-1.5, 1), (5, 5), (1.5, 0)], math.instance('points'), math.channel(vector='x,y'))
+        math.assert_close(union.lies_inside(loc), math.wrap([True, True, True, False, False], math.instance('points')))
+        expected = math.min(math.stack([g.approximate_signed_distance(loc) for g in geometries], math.instance('geometries')), 'geometries')
+        math.assert_close(union.approximate_signed_distance(loc), expected)
+
+    def test_union_bounds(self):
+        union = geom.union(Box(x=1, y=1), Sphere(x=3, y=0, radius=1))
+        math.assert_close(union.center, vec(x=2, y=0))
+        math.assert_close(union.bounding_half_extent(), vec(x=2, y=1))
+        math.assert_close(union.shifted(vec(x=1, y=0)).center, vec(x=3, y=0))
+
     def test_infinite_cylinder(self):
         cylinder = geom.infinite_cylinder(x=.5, y=.5, radius=.5, inf_dim=math.spatial('z'))
         self.assertEqual(3, cylinder.spatial_rank)
@@ -37,5 +37,52 @@ class FlipTest(TestCase):
         assert math.any(OBSTACLE.lies_inside(particles.points))
         assert math.any((~particles.bounds).lies_inside(particles.points))
         particles = fluid.boundary_push(particles, [OBSTACLE, ~particles.bounds], offset=0.1)
+        self.assertEqual(math.DType(float, 32), particles.points.dtype)  # integer obstacle bounds must not promote the positions
         assert math.all(~OBSTACLE.lies_inside(particles.points))
         assert math.all(~(~particles.bounds).lies_inside(particles.points))
+
+    def test_map_velocity_to_particles(self):
+        """ Tests that the single-interpolation FLIP / PIC blend matches the explicit formula. """
+        particles = distribute_points(Box['x,y', 8:24, 8:24], x=32, y=32) * (1, -1)
+        prev_velocity = resample(particles, StaggeredGrid(0, 0, particles.bounds, x=32, y=32), outside_handling='clamp', scatter=True)
+        prev_velocity = field.finite_fill(prev_velocity)
+        velocity = prev_velocity + (0, -1)
+        v_new, v_old = resample(velocity, particles).values, resample(prev_velocity, particles).values
+        for viscosity in (0, 0.3, 1):
+            result = fluid.map_velocity_to_particles(particles, velocity, prev_velocity, viscosity=viscosity)
+            expected = (1 - viscosity) * (particles.values + v_new - v_old) + viscosity * v_new
+            math.assert_close(expected, result.values, abs_tolerance=1e-5)
+        math.assert_close(v_new, fluid.map_velocity_to_particles(particles, velocity).values)
+
+    def test_sort_particles_by_cell(self):
+        points = tensor([(3.5, 3.5), (1.5, .5), (.5, 1.5), (.5, .5), (2.5, .5)], instance('points'), channel(vector='x,y'))
+        particles = PointCloud(Sphere(points, radius=.1), math.range(instance(points)), bounds=Box(x=4, y=4))
+        result = fluid.sort_particles_by_cell(particles, spatial(x=4, y=4))
+        math.assert_close([3, 1, 2, 4, 0], result.values)
+        math.assert_close(points[{'points': result.values}], result.points)
+        # non-square grid, particles outside along y are clamped to the last row, not sorted past it
+        points = tensor([(.5, 5), (1.5, 1.5), (.5, .5), (1.5, -3)], instance('points'), channel(vector='x,y'))
+        particles = PointCloud(Sphere(points, radius=.1), math.range(instance(points)), bounds=Box(x=8, y=2))
+        result = fluid.sort_particles_by_cell(particles, spatial(x=8, y=2))
+        math.assert_close([2, 3, 0, 1], result.values)
+
+    def test_boundary_push_collection(self):
+        obstacles = [Box['x,y', 10:20, 10:20], Box['x,y', 30:40, 10:20], Sphere(x=50, y=50, radius=5), ~Box['x,y', 0:64, 0:64]]
+        particles = PointCloud(Sphere(math.random_uniform(instance(points=200), channel(vector='x,y')) * 70 - 3, radius=.1))
+        result = fluid.boundary_push(particles, obstacles, offset=0.1)
+        pos = particles.points
+        for obstacle in obstacles:
+            pos = obstacle.push(pos, shift_amount=0.1)
+        math.assert_close(pos, result.points, abs_tolerance=1e-5)
+        # overlapping boxes and boxes that already form a collection must be pushed sequentially
+        points = tensor([(7, 5), (2, 2), (30, 5), (12, 8)], instance('points'), channel(vector='x,y'))
+        particles = PointCloud(Sphere(points, radius=.1))
+        for obstacles in ([Box['x,y', 0:10, 0:10], Box['x,y', 5:15, 0:10]],
+                          [union(Box['x,y', 0:4, 0:4], Box['x,y', 20:40, 0:10]), Box['x,y', 5:15, 0:10]]):
+            result = fluid.boundary_push(particles, obstacles, offset=0.1)
+            pos = points
+            for obstacle in obstacles:
+                pos = obstacle.push(pos, shift_amount=0.1)
+            math.assert_close(pos, result.points, abs_tolerance=1e-5)
+            for obstacle in obstacles:
+                assert not math.any(obstacle.lies_inside(result.points))
@@ -70,3 +70,23 @@ class FluidTest(TestCase):
                     assert math.isfinite(grad.values).all
                     grads.append(grad)
         math.assert_close(*grads, abs_tolerance=1e-5)
+
+    def test_masked_laplace_symmetric(self):
+        for ext in [ZERO, BOUNDARY, PERIODIC]:
+            velocity = StaggeredGrid(0, ext, x=8, y=6, bounds=Box['x,y', 0:8, 0:6])
+            accessible = CenteredGrid(~Box['x,y', 2:4, 1:3], fluid._accessible_extrapolation(ext), velocity.bounds, velocity.resolution)
+            hard_bcs = field.stagger(accessible, math.minimum, ext, type=StaggeredGrid)
+            pressure = CenteredGrid(0, fluid._pressure_extrapolation(ext), velocity.bounds, velocity.resolution)
+            matrix = fluid.masked_laplace.sparse_matrix_and_bias(pressure, hard_bcs, accessible.with_extrapolation(math.extrapolation.NONE))[0]
+            dense = math.dense(matrix).numpy('~x,~y,x,y').reshape(48, 48)
+            math.assert_close(dense, dense.T, msg=f"Laplace matrix not symmetric for {ext}")
+
+    def test_make_incompressible_precomputed_masks(self):
+        velocity = StaggeredGrid(Noise(vector=2), ZERO, x=16, y=12, bounds=Box['x,y', 0:16, 0:12])
+        obstacle = Box['x,y', 4:8, 2:6]
+        masks = fluid.obstacle_masks(obstacle, velocity)
+        math.assert_close(0, masks[0].values.x[5].y[3])
+        v1, p1 = fluid.make_incompressible(velocity, obstacle, masks=masks)
+        v2, p2 = fluid.make_incompressible(velocity, obstacle)
+        math.assert_close(v1.values, v2.values, abs_tolerance=1e-5)
+        math.assert_close(p1.values, p2.values, abs_tolerance=1e-5)